@@ -1,7 +1,10 @@
 
 
 import asyncio
+import atexit
 import logging
+import logging.handlers
+import queue
 from typing import Dict, Any
 
 from aiogram import Bot, Dispatcher
@@ -13,12 +16,29 @@ from config import BOT_TOKEN, BOT_MODE, WEBHOOK_PATH, WEBHOOK_URL, PORT, HOST
 from handlers.handlers import register_handlers
 from handlers.admin import register_admin_handlers
 from utils.cleanup import cleanup_temp_directory
+from utils.log_context import RequestContextFilter
 
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    format='%(asctime)s - %(name)s - %(levelname)s - %(request)s%(message)s'
 )
+
+# Emit log records through a queue so the stream writes (and the final
+# Formatter pass) happen on a background thread. QueueHandler.prepare() still
+# merges msg % args and renders tracebacks on the calling thread
+_root_logger = logging.getLogger()
+_log_queue = queue.SimpleQueue()
+_log_listener = logging.handlers.QueueListener(
+    _log_queue, *_root_logger.handlers, respect_handler_level=True
+)
+_queue_handler = logging.handlers.QueueHandler(_log_queue)
+# Request context lives in contextvars, so it must be read on the caller's side
+_queue_handler.addFilter(RequestContextFilter())
+_root_logger.handlers = [_queue_handler]
+_log_listener.start()
+atexit.register(_log_listener.stop)
+
 logger = logging.getLogger(__name__)
 
 
@@ -75,7 +95,7 @@ class VidZillaBot:
 
     async def _on_startup(self, app: web.Application) -> None:
         webhook_url = WEBHOOK_URL + WEBHOOK_PATH
-        logger.info(f"Setting webhook to {webhook_url}")
+        logger.info("Setting webhook to %s", webhook_url)
         await self.bot.set_webhook(webhook_url)
         logger.info("Webhook set successfully")
 
@@ -126,7 +146,7 @@ class VidZillaBot:
                 await self.runner.setup()
 
                 site = web.TCPSite(self.runner, HOST, PORT)
-                logger.info(f"Starting web application on {HOST}:{PORT}")
+                logger.info("Starting web application on %s:%s", HOST, PORT)
                 await site.start()
 
                 logger.info("Vidzilla Bot - FREE Version started successfully!")
@@ -137,7 +157,7 @@ class VidZillaBot:
         except KeyboardInterrupt:
             logger.info("Received shutdown signal")
         except Exception as e:
-            logger.error(f"Application error: {e}")
+            logger.error("Application error: %s", e)
             raise
         finally:
             await self._cleanup()
@@ -160,7 +180,7 @@ async def main() -> None:
     except KeyboardInterrupt:
         logger.info("Bot stopped by user")
     except Exception as e:
-        logger.error(f"Fatal error: {e}")
+        logger.error("Fatal error: %s", e)
         raise
 
 
@@ -170,5 +190,5 @@ if __name__ == "__main__":
     except KeyboardInterrupt:
         logger.info("Application terminated")
     except Exception as e:
-        logger.error(f"Application failed to start: {e}")
+        logger.error("Application failed to start: %s", e)
         exit(1)
@@ -14,6 +14,9 @@ BASE_DIR = os.path.dirname(os.path.abspath(__file__))
 # Временная директория для хранения загруженных видео
 TEMP_DIRECTORY = os.path.join(BASE_DIR, "temp_videos")
 
+# yt-dlp cache (player JS, signatures) — kept on disk so it survives restarts
+YTDLP_CACHE_DIR = os.path.join(BASE_DIR, ".ytdlp_cache")
+
 # Cookies file for platforms that require login (Instagram, TikTok)
 # Export from browser using "Get cookies.txt" extension
 COOKIES_FILE = os.path.join(BASE_DIR, "cookies.txt")
@@ -69,3 +72,13 @@ def extract_url(text: str) -> Optional[str]:
     """Extract the first URL from text."""
     match = URL_PATTERN.search(text)
     return match.group(0) if match else None
+
+
+# Single-pass platform matcher; leftmost match wins, ties go to the earlier key
+PLATFORM_PATTERN = re.compile("|".join(map(re.escape, PLATFORM_IDENTIFIERS)))
+
+
+def detect_platform(url: str) -> Optional[str]:
+    """Return the platform name for a URL, or None if unsupported."""
+    match = PLATFORM_PATTERN.search(url)
+    return PLATFORM_IDENTIFIERS[match.group(0)] if match else None
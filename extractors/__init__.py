@@ -32,6 +32,11 @@ _EXTRACTORS = {
 }
 
 
+def has_extractor(platform_name: str) -> bool:
+    """Return True if a direct extractor is registered for the platform."""
+    return platform_name in _EXTRACTORS
+
+
 def get_extractor(platform_name: str, session: aiohttp.ClientSession) -> Optional[BaseExtractor]:
     """Factory: returns an extractor instance for the given platform, or None."""
     cls = _EXTRACTORS.get(platform_name)
@@ -40,6 +45,7 @@ def get_extractor(platform_name: str, session: aiohttp.ClientSession) -> Optiona
 
 __all__ = [
     "get_extractor",
+    "has_extractor",
     "VideoResult",
     "BaseExtractor",
     "InstagramExtractor",
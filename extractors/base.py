@@ -52,11 +52,11 @@ class BaseExtractor:
 
             async with self.session.request(method, url, **kwargs) as resp:
                 if resp.status != 200:
-                    self.logger.warning(f"HTTP {resp.status} for {url}")
+                    self.logger.warning("HTTP %s for %s", resp.status, url)
                     return None
                 return await resp.text()
         except Exception as e:
-            self.logger.warning(f"Fetch error for {url}: {e}")
+            self.logger.warning("Fetch error for %s: %s", url, e)
             return None
 
     async def fetch_json(
@@ -78,11 +78,11 @@ class BaseExtractor:
 
             async with self.session.request(method, url, **kwargs) as resp:
                 if resp.status != 200:
-                    self.logger.warning(f"HTTP {resp.status} for {url}")
+                    self.logger.warning("HTTP %s for %s", resp.status, url)
                     return None
                 return await resp.json(content_type=None)
         except Exception as e:
-            self.logger.warning(f"Fetch JSON error for {url}: {e}")
+            self.logger.warning("Fetch JSON error for %s: %s", url, e)
             return None
 
     async def resolve_redirect(self, url: str, headers: Optional[Dict[str, str]] = None) -> Optional[str]:
@@ -96,7 +96,7 @@ class BaseExtractor:
             ) as resp:
                 return str(resp.url)
         except Exception as e:
-            self.logger.warning(f"Redirect resolve error for {url}: {e}")
+            self.logger.warning("Redirect resolve error for %s: %s", url, e)
             return None
 
     async def extract(self, url: str) -> Optional[VideoResult]:
@@ -109,7 +109,7 @@ class InstagramExtractor(BaseExtractor):
             if embed_data and embed_data.get("contextJSON"):
                 return json.loads(embed_data["contextJSON"])
         except Exception as e:
-            self.logger.debug(f"Embed parse error: {e}")
+            self.logger.debug("Embed parse error: %s", e)
         return None
 
     # ------ GraphQL API ------
@@ -170,7 +170,7 @@ class InstagramExtractor(BaseExtractor):
             if data and data.get("data"):
                 return {"gql_data": data["data"]}
         except Exception as e:
-            self.logger.debug(f"GQL error: {e}")
+            self.logger.debug("GQL error: %s", e)
         return None
 
     # ------ Result extraction ------
@@ -303,7 +303,7 @@ class InstagramExtractor(BaseExtractor):
 
         post_id = self._extract_post_id(url)
         if not post_id:
-            self.logger.debug(f"Could not extract post ID from {url}")
+            self.logger.debug("Could not extract post ID from %s", url)
             return None
 
         # Strategy 1: Mobile API
@@ -314,10 +314,10 @@ class InstagramExtractor(BaseExtractor):
                 if data:
                     result = self._extract_from_mobile_api(data, post_id)
                     if result:
-                        self.logger.info(f"Instagram: extracted via mobile API")
+                        self.logger.info("Instagram: extracted via mobile API")
                         return result
         except Exception as e:
-            self.logger.debug(f"Mobile API failed: {e}")
+            self.logger.debug("Mobile API failed: %s", e)
 
         # Strategy 2: Embed page
         try:
@@ -325,10 +325,10 @@ class InstagramExtractor(BaseExtractor):
             if embed_data:
                 result = self._extract_from_embed(embed_data, post_id)
                 if result:
-                    self.logger.info(f"Instagram: extracted via embed")
+                    self.logger.info("Instagram: extracted via embed")
                     return result
         except Exception as e:
-            self.logger.debug(f"Embed failed: {e}")
+            self.logger.debug("Embed failed: %s", e)
 
         # Strategy 3: GraphQL
         try:
@@ -336,10 +336,10 @@ class InstagramExtractor(BaseExtractor):
             if gql_data:
                 result = self._extract_from_gql(gql_data, post_id)
                 if result:
-                    self.logger.info(f"Instagram: extracted via GQL")
+                    self.logger.info("Instagram: extracted via GQL")
                     return result
         except Exception as e:
-            self.logger.debug(f"GQL failed: {e}")
+            self.logger.debug("GQL failed: %s", e)
 
-        self.logger.warning(f"Instagram: all methods failed for {post_id}")
+        self.logger.warning("Instagram: all methods failed for %s", post_id)
         return None
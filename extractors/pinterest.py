@@ -62,7 +62,7 @@ class PinterestExtractor(BaseExtractor):
                 pin_id = self._extract_pin_id(resolved)
 
         if not pin_id:
-            self.logger.debug(f"Could not extract Pinterest pin ID from {url}")
+            self.logger.debug("Could not extract Pinterest pin ID from %s", url)
             return None
 
         # Fetch pin page
@@ -76,7 +76,7 @@ class PinterestExtractor(BaseExtractor):
 
         # Check if pin exists
         if NOT_FOUND_REGEX.search(html):
-            self.logger.debug(f"Pinterest pin not found: {pin_id}")
+            self.logger.debug("Pinterest pin not found: %s", pin_id)
             return None
 
         # Look for video
@@ -104,5 +104,5 @@ class PinterestExtractor(BaseExtractor):
                 is_photo=True,
             )
 
-        self.logger.debug(f"Pinterest: no media found for {pin_id}")
+        self.logger.debug("Pinterest: no media found for %s", pin_id)
         return None
@@ -74,7 +74,7 @@ class RedditExtractor(BaseExtractor):
 
         post_id = info.get("id")
         if not post_id:
-            self.logger.debug(f"Could not extract Reddit post ID from {url}")
+            self.logger.debug("Could not extract Reddit post ID from %s", url)
             return None
 
         # Fetch post JSON
@@ -116,7 +116,7 @@ class RedditExtractor(BaseExtractor):
                 reddit_video = reddit_video.get("reddit_video")
 
         if not reddit_video:
-            self.logger.debug(f"No Reddit video found for {post_id}")
+            self.logger.debug("No Reddit video found for %s", post_id)
             return None
 
         fallback_url = reddit_video.get("fallback_url", "")
@@ -56,7 +56,7 @@ class TikTokExtractor(BaseExtractor):
                     if "tiktok.com" in extracted:
                         return extracted
         except Exception as e:
-            self.logger.debug(f"Short link resolve error: {e}")
+            self.logger.debug("Short link resolve error: %s", e)
 
         # Fallback: follow redirects
         resolved = await self.resolve_redirect(url)
@@ -80,7 +80,7 @@ class TikTokExtractor(BaseExtractor):
                 post_id = self._extract_post_id(resolved_url)
 
         if not post_id:
-            self.logger.debug(f"Could not extract TikTok post ID from {url}")
+            self.logger.debug("Could not extract TikTok post ID from %s", url)
             return None
 
         # Fetch video page — always use /video/ path (works for photos too)
@@ -110,7 +110,7 @@ class TikTokExtractor(BaseExtractor):
 
             # Check if post is unavailable
             if video_detail.get("statusMsg"):
-                self.logger.debug(f"TikTok post unavailable: {video_detail['statusMsg']}")
+                self.logger.debug("TikTok post unavailable: %s", video_detail['statusMsg'])
                 return None
 
             detail = video_detail.get("itemInfo", {}).get("itemStruct")
@@ -118,7 +118,7 @@ class TikTokExtractor(BaseExtractor):
                 return None
 
         except (json.JSONDecodeError, IndexError, KeyError) as e:
-            self.logger.debug(f"TikTok parse error: {e}")
+            self.logger.debug("TikTok parse error: %s", e)
             return None
 
         # Check content classification (age-restricted)
@@ -203,7 +203,7 @@ class TwitterExtractor(BaseExtractor):
             return base_tweet.get("extended_entities", {}).get("media")
 
         except Exception as e:
-            self.logger.debug(f"GraphQL extraction error: {e}")
+            self.logger.debug("GraphQL extraction error: %s", e)
             return None
 
     async def extract(self, url: str) -> Optional[VideoResult]:
@@ -216,7 +216,7 @@ class TwitterExtractor(BaseExtractor):
                 tweet_id = self._extract_tweet_id(resolved)
 
         if not tweet_id:
-            self.logger.debug(f"Could not extract tweet ID from {url}")
+            self.logger.debug("Could not extract tweet ID from %s", url)
             return None
 
         media = None
@@ -227,9 +227,9 @@ class TwitterExtractor(BaseExtractor):
             if syn_data:
                 media = syn_data.get("mediaDetails")
                 if media:
-                    self.logger.info(f"Twitter: extracted via syndication")
+                    self.logger.info("Twitter: extracted via syndication")
         except Exception as e:
-            self.logger.debug(f"Syndication failed: {e}")
+            self.logger.debug("Syndication failed: %s", e)
 
         # Strategy 2: GraphQL API fallback
         if not media:
@@ -240,9 +240,9 @@ class TwitterExtractor(BaseExtractor):
                     if data:
                         media = self._extract_media_from_graphql(data, tweet_id)
                         if media:
-                            self.logger.info(f"Twitter: extracted via GraphQL")
+                            self.logger.info("Twitter: extracted via GraphQL")
             except Exception as e:
-                self.logger.debug(f"GraphQL failed: {e}")
+                self.logger.debug("GraphQL failed: %s", e)
 
         # Strategy 3: fxtwitter API (public proxy)
         if not media:
@@ -256,7 +256,7 @@ class TwitterExtractor(BaseExtractor):
                     if videos:
                         video_url = videos[0].get("url")
                         if video_url:
-                            self.logger.info(f"Twitter: extracted via fxtwitter")
+                            self.logger.info("Twitter: extracted via fxtwitter")
                             return VideoResult(
                                 url=video_url,
                                 filename=f"twitter_{tweet_id}.mp4",
@@ -271,7 +271,7 @@ class TwitterExtractor(BaseExtractor):
                                 filename=f"twitter_{tweet_id}.jpg",
                             )
             except Exception as e:
-                self.logger.debug(f"fxtwitter failed: {e}")
+                self.logger.debug("fxtwitter failed: %s", e)
 
         if not media:
             return None
@@ -114,7 +114,7 @@ class YouTubeExtractor(BaseExtractor):
     async def extract(self, url: str) -> Optional[VideoResult]:
         video_id = self._extract_video_id(url)
         if not video_id:
-            self.logger.debug(f"Could not extract YouTube video ID from {url}")
+            self.logger.debug("Could not extract YouTube video ID from %s", url)
             return None
 
         data = await self._innertube_request(video_id)
@@ -127,7 +127,7 @@ class YouTubeExtractor(BaseExtractor):
 
         if status != "OK":
             reason = playability.get("reason", "unknown")
-            self.logger.debug(f"YouTube video not playable: {status} - {reason}")
+            self.logger.debug("YouTube video not playable: %s - %s", status, reason)
             return None
 
         # Check for live stream
@@ -139,7 +139,7 @@ class YouTubeExtractor(BaseExtractor):
         # Check duration (skip very long videos > 1 hour for Telegram)
         duration_seconds = int(video_details.get("lengthSeconds", 0))
         if duration_seconds > 3600:
-            self.logger.debug(f"YouTube video too long: {duration_seconds}s")
+            self.logger.debug("YouTube video too long: %ss", duration_seconds)
             return None
 
         streaming_data = data.get("streamingData", {})
@@ -194,5 +194,5 @@ class YouTubeExtractor(BaseExtractor):
                 duration=duration_seconds,
             )
 
-        self.logger.warning(f"YouTube: no suitable format found for {video_id}")
+        self.logger.warning("YouTube: no suitable format found for %s", video_id)
         return None
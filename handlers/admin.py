@@ -78,11 +78,11 @@ Total: {successful_sends + failed_sends}
 """
 
         await message.answer(result_message, parse_mode="Markdown")
-        logger.info(f"Broadcast completed: {successful_sends} successful, {failed_sends} failed")
+        logger.info("Broadcast completed: %s successful, %s failed", successful_sends, failed_sends)
 
     except Exception as e:
         await message.answer(f"Broadcast failed: {str(e)}")
-        logger.error(f"Broadcast error: {e}")
+        logger.error("Broadcast error: %s", e)
 
     await state.clear()
 
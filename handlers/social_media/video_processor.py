@@ -1,33 +1,86 @@
 
 import asyncio
+import copy
+import itertools
 import logging
 import os
-import uuid
-from typing import Optional
+import random
+import re
+import secrets
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Optional
 
 import aiohttp
 import yt_dlp
+from yt_dlp.networking.exceptions import HTTPError as YtdlpHTTPError
 from aiogram.types import FSInputFile
 
-from config import TEMP_DIRECTORY, PLATFORM_IDENTIFIERS, COOKIES_FILE, COOKIES_ENABLED
+from config import TEMP_DIRECTORY, COOKIES_FILE, COOKIES_ENABLED, YTDLP_CACHE_DIR, detect_platform
 from utils.user_agent_utils import get_random_user_agent
-from utils.common_utils import safe_edit_message
-from utils.cleanup import cleanup_temp_directory
-from extractors import get_extractor
+from utils.common_utils import ProgressEditor
+from utils.cleanup import cleanup_temp_directory, safe_unlink
+from utils.log_context import request_context, run_in_executor
+from extractors import get_extractor, has_extractor
 
 # Set up logging
 logger = logging.getLogger(__name__)
 
 # Telegram limits
 TELEGRAM_VIDEO_SIZE_LIMIT_MB = 50  # Telegram's video size limit
+TELEGRAM_VIDEO_SIZE_LIMIT_BYTES = TELEGRAM_VIDEO_SIZE_LIMIT_MB * 1024 * 1024
+
+# Read uploads in 1 MiB chunks (aiogram default is 64 KiB) — fewer read syscalls
+UPLOAD_CHUNK_SIZE = 1024 * 1024
 
 # Retry format strings (best → worst)
+# Pre-muxed h264 mp4 first so yt-dlp doesn't have to remux through ffmpeg
 FORMAT_ATTEMPTS = [
-    'best[ext=mp4][filesize<50M]/best[ext=mp4]/best[filesize<50M]',
+    'best[ext=mp4][vcodec^=avc1][filesize<50M]/best[ext=mp4][filesize<50M]/best[ext=mp4]/best[filesize<50M]',
     'best/bestvideo+bestaudio',
     'worst',
 ]
 
+# Extensions yt-dlp may produce for the output template
+VIDEO_EXTENSIONS = ('.mp4', '.webm', '.mkv', '.avi', '.mov', '.flv', '.m4v')
+
+# Backoff between attempts (only for throttling / server errors)
+MAX_RETRY_WAIT = 30
+HTTP_5XX_PATTERN = re.compile(r'HTTP Error 5\d\d')
+THROTTLE_PATTERN = re.compile(r'HTTP Error 429|too many requests', re.IGNORECASE)
+
+# yt-dlp error → user message, checked in order (first match wins)
+DOWNLOAD_ERROR_RULES = [
+    (re.compile(r'private', re.IGNORECASE),
+     "🔒 This video is private"),
+    (re.compile(r'login|authentication|cookies', re.IGNORECASE),
+     "🔑 This platform requires login — try sending a different link or a public video"),
+    (re.compile(r'not found|404|deleted|does not exist', re.IGNORECASE),
+     "❌ Video not found — it may have been deleted"),
+    (re.compile(r'\bage\b|sign in', re.IGNORECASE),
+     "🔞 Age-restricted content — can't download"),
+    (re.compile(r'geo|country|not available|blocked', re.IGNORECASE),
+     "🌍 This video is not available in our region"),
+    (re.compile(r'rate|too many|429', re.IGNORECASE),
+     "⏳ Too many requests — try again in a minute"),
+    (re.compile(r'timed out|timeout|urlopen error', re.IGNORECASE),
+     "⏳ Timeout — try again in a moment"),
+    (re.compile(r'copyright|dmca', re.IGNORECASE),
+     "🚫 This video was removed due to copyright"),
+    (re.compile(r'no video|no media', re.IGNORECASE),
+     "📝 This post doesn't contain a video"),
+    (re.compile(r'unsupported|unable to extract', re.IGNORECASE),
+     "🚫 This platform blocked the download — try again later"),
+]
+
+# Non-yt-dlp errors raised while processing a request
+GENERIC_ERROR_RULES = [
+    (re.compile(r'timeout|timed out', re.IGNORECASE),
+     "⏳ Timeout — try again in a moment"),
+    (re.compile(r'failed to download', re.IGNORECASE),
+     "⚠️ Download failed — please try another link"),
+]
+
 # Progress messages
 PROGRESS_MESSAGES = {
     'downloading': '⬇️ Downloading from {platform}...',
@@ -38,43 +91,115 @@ PROGRESS_MESSAGES = {
     'too_large': '📦 Too large: {size:.1f}MB (limit: 50MB)',
 }
 
+# Dedicated pool for blocking yt-dlp work so it can't starve the default executor.
+# Short housekeeping (closing, unlinking) goes to the default executor instead,
+# so it never queues behind long downloads
+_DOWNLOAD_POOL = ThreadPoolExecutor(max_workers=16, thread_name_prefix="ytdlp")
+
+# Temp file request ids: random per-process prefix + counter, so names stay
+# unique across restarts (leftover files live up to an hour) without
+# hitting the RNG on every request
+_REQ_PREFIX = secrets.token_hex(2)
+_REQ_COUNTER = itertools.count()
+
+
+def new_request_id() -> str:
+    return f"{_REQ_PREFIX}{next(_REQ_COUNTER):06x}"
 
-def get_file_size_mb(file_path: str) -> float:
+
+def get_file_size(file_path: str) -> int:
     try:
-        size_bytes = os.path.getsize(file_path)
-        return size_bytes / (1024 * 1024)
+        return os.path.getsize(file_path)
     except Exception:
-        return 0.0
+        return 0
+
+
+def _match_error(rules, error_str: str) -> Optional[str]:
+    for pattern, user_message in rules:
+        if pattern.search(error_str):
+            return user_message
+    return None
 
 
 def classify_download_error(error: Exception) -> str:
     """Classify a yt-dlp error into a user-friendly message."""
-    error_str = str(error).lower()
-
-    if 'private' in error_str:
-        return "🔒 This video is private"
-    if 'login' in error_str or 'authentication' in error_str or 'cookies' in error_str:
-        return "🔑 This platform requires login — try sending a different link or a public video"
-    elif 'not found' in error_str or '404' in error_str or 'deleted' in error_str or 'does not exist' in error_str:
-        return "❌ Video not found — it may have been deleted"
-    elif 'age' in error_str or 'sign in' in error_str or 'confirm your age' in error_str:
-        return "🔞 Age-restricted content — can't download"
-    elif 'geo' in error_str or 'country' in error_str or 'not available' in error_str or 'blocked' in error_str:
-        return "🌍 This video is not available in our region"
-    elif 'rate' in error_str or 'too many' in error_str or '429' in error_str:
-        return "⏳ Too many requests — try again in a minute"
-    elif 'timed out' in error_str or 'timeout' in error_str or 'urlopen error' in error_str:
-        return "⏳ Timeout — try again in a moment"
-    elif 'copyright' in error_str or 'dmca' in error_str:
-        return "🚫 This video was removed due to copyright"
-    elif 'no video' in error_str or 'no media' in error_str:
-        return "📝 This post doesn't contain a video"
-    elif 'unsupported' in error_str or 'unable to extract' in error_str:
-        return "🚫 This platform blocked the download — try again later"
-    else:
-        # Show first 100 chars of error for debugging
-        short = str(error)[:100]
-        return f"⚠️ Download failed: {short}"
+    error_str = str(error)
+    user_message = _match_error(DOWNLOAD_ERROR_RULES, error_str)
+    if user_message:
+        return user_message
+
+    # Show first 100 chars of error for debugging
+    return f"⚠️ Download failed: {error_str[:100]}"
+
+
+def is_transient_error(error: Exception) -> bool:
+    """Throttling or server-side failure: worth retrying whatever else the message says."""
+    error_str = str(error)
+    return bool(THROTTLE_PATTERN.search(error_str) or HTTP_5XX_PATTERN.search(error_str))
+
+
+def get_retry_after(error: Exception) -> Optional[int]:
+    """Retry-After seconds from the HTTP response behind a yt-dlp error, if it sent one."""
+    # DownloadError -> ExtractorError (exc_info) -> HTTPError (cause)
+    exc = error
+    for _ in range(4):
+        if exc is None or isinstance(exc, YtdlpHTTPError):
+            break
+        exc_info = getattr(exc, 'exc_info', None)
+        exc = getattr(exc, 'cause', None) or (exc_info[1] if exc_info else None)
+    if not isinstance(exc, YtdlpHTTPError):
+        return None
+
+    value = exc.response.headers.get('Retry-After', '').strip()
+    # Only the delay-seconds form; HTTP-date values fall back to backoff
+    return int(value) if value.isdigit() else None
+
+
+def get_retry_delay(error: Exception, attempt: int) -> float:
+    """Seconds to wait before the next attempt; 0 when retrying right away is fine."""
+    error_str = str(error)
+
+    # Throttled: honor Retry-After if the server sent one, else jittered backoff
+    if THROTTLE_PATTERN.search(error_str):
+        retry_after = get_retry_after(error)
+        if retry_after is not None:
+            return min(retry_after, MAX_RETRY_WAIT) + random.random()
+        return min(2 ** attempt, MAX_RETRY_WAIT) + random.uniform(0, 1.0)
+
+    # Server errors: full jitter so concurrent users don't retry in lockstep
+    if HTTP_5XX_PATTERN.search(error_str):
+        return random.uniform(0, min(2 ** attempt, MAX_RETRY_WAIT))
+
+    # Format/extraction problems: next format can be tried immediately
+    return 0.0
+
+
+def find_downloaded_file(result: dict, base_path: str) -> Optional[str]:
+    """Path of the file yt-dlp wrote for ``result``, or None if nothing is on disk."""
+    # Playlists (multi-video posts, galleries) report downloads on their entries
+    candidates = [result]
+    candidates.extend(entry for entry in result.get('entries') or [] if entry)
+    for item in candidates:
+        for download in item.get('requested_downloads') or []:
+            path = download.get('filepath')
+            if path and os.path.exists(path):
+                return path
+
+    # Fall back to probing the output template's extensions
+    for ext in VIDEO_EXTENSIONS:
+        path = base_path + ext
+        if os.path.exists(path):
+            return path
+    return None
+
+
+def remove_partial_files(base_path: str) -> None:
+    """Remove leftovers of a failed yt-dlp attempt (blocking, run off-loop)."""
+    for ext in VIDEO_EXTENSIONS + ('.part',):
+        try:
+            safe_unlink(base_path + ext)
+        except OSError:
+            pass
 
 
 class SimpleVideoDownloader:
@@ -82,9 +207,15 @@ class SimpleVideoDownloader:
     def __init__(self):
         self.temp_dir = TEMP_DIRECTORY
         os.makedirs(self.temp_dir, exist_ok=True)
+        # URL -> future of the download currently running for it
+        self._inflight: Dict[str, asyncio.Future] = {}
 
     async def try_extractor(self, url: str, platform_name: str, user_id: int) -> Optional[str]:
         """Try Cobalt-style direct extraction before falling back to yt-dlp."""
+        # No extractor registered (e.g. Vimeo) — don't open a session for nothing
+        if not has_extractor(platform_name):
+            return None
+
         try:
             async with aiohttp.ClientSession() as session:
                 extractor = get_extractor(platform_name, session)
@@ -96,7 +227,7 @@ class SimpleVideoDownloader:
                     return None
 
                 # Download from direct URL
-                request_id = str(uuid.uuid4())[:8]
+                request_id = new_request_id()
                 ext = "jpg" if result.is_photo else "mp4"
                 filename = f"{platform_name.lower()}_{user_id}_{request_id}.{ext}"
                 output_path = os.path.join(self.temp_dir, filename)
@@ -111,13 +242,13 @@ class SimpleVideoDownloader:
                     timeout=aiohttp.ClientTimeout(total=60),
                 ) as resp:
                     if resp.status != 200:
-                        logger.warning(f"Extractor download HTTP {resp.status} for {result.url[:80]}")
+                        logger.warning("Extractor download HTTP %s for %.80s", resp.status, result.url)
                         return None
 
                     # Check content length if available
                     content_length = resp.content_length
-                    if content_length and content_length > TELEGRAM_VIDEO_SIZE_LIMIT_MB * 1024 * 1024:
-                        logger.info(f"Extractor: file too large ({content_length} bytes), skipping")
+                    if content_length and content_length > TELEGRAM_VIDEO_SIZE_LIMIT_BYTES:
+                        logger.info("Extractor: file too large (%d bytes), skipping", content_length)
                         return None
 
                     with open(output_path, "wb") as f:
@@ -126,23 +257,23 @@ class SimpleVideoDownloader:
                             f.write(chunk)
                             total += len(chunk)
                             # Safety limit: stop if exceeding 50MB
-                            if total > TELEGRAM_VIDEO_SIZE_LIMIT_MB * 1024 * 1024:
+                            if total > TELEGRAM_VIDEO_SIZE_LIMIT_BYTES:
                                 logger.info("Extractor: exceeded size limit during download")
                                 os.unlink(output_path)
                                 return None
 
-                if os.path.exists(output_path) and os.path.getsize(output_path) > 0:
-                    size_mb = get_file_size_mb(output_path)
+                # Bytes written are already counted, no need to stat the file
+                if total > 0:
                     logger.info(
-                        f"Extractor: downloaded {platform_name} media: "
-                        f"{size_mb:.2f}MB via direct extraction"
+                        "Extractor: downloaded %.2fMB via direct extraction",
+                        total / (1024 * 1024)
                     )
                     return output_path
                 else:
                     return None
 
         except Exception as e:
-            logger.warning(f"Extractor failed for {platform_name}: {e}")
+            logger.warning("Extractor failed: %s", e)
             return None
 
     def get_simple_ytdlp_options(self, output_path: str, format_string: str) -> dict:
@@ -153,10 +284,15 @@ class SimpleVideoDownloader:
             'writesubtitles': False,
             'writethumbnail': False,
             'writeautomaticsub': False,
+            'postprocessors': [],
+            'prefer_free_formats': False,
             'ignoreerrors': False,
             'no_warnings': False,
             'extract_flat': False,
-            'http_headers': {'User-Agent': get_random_user_agent()},
+            'http_headers': {
+                'User-Agent': get_random_user_agent(),
+                'Connection': 'keep-alive',
+            },
             'socket_timeout': 30,
             'retries': 3,
             'fragment_retries': 3,
@@ -168,6 +304,7 @@ class SimpleVideoDownloader:
             'no_color': True,
             'geo_bypass': True,
             'nocheckcertificate': True,
+            'cachedir': YTDLP_CACHE_DIR,
             'extractor_args': {
                 'youtube': {'player_client': ['ios', 'web']},
                 'tiktok': {'api_hostname': ['api22-normal-c-useast2a.tiktokv.com']},
@@ -182,86 +319,160 @@ class SimpleVideoDownloader:
         return opts
 
     async def download_video(self, url: str, platform_name: str, user_id: int) -> Optional[str]:
+        """Download video, sharing one download between concurrent requests for a URL.
+
+        Each caller gets its own path (followers get a hardlink to the leader's
+        file) so cleanup stays per request.
+        """
+        pending = self._inflight.get(url)
+        if pending is not None:
+            try:
+                source_path = await asyncio.shield(pending)
+            except asyncio.CancelledError:
+                if not pending.cancelled():
+                    raise
+                # Leader was cancelled — do our own download
+                return await self._download_video(url, platform_name, user_id)
+
+            # Link right away, before the leader gets a chance to clean up
+            linked_path = self._link_for_user(source_path, platform_name, user_id)
+            if linked_path:
+                logger.info("Reused in-flight download")
+                return linked_path
+            return await self._download_video(url, platform_name, user_id)
+
+        future = asyncio.get_event_loop().create_future()
+        # Mark the exception retrieved when nobody else was waiting on it
+        future.add_done_callback(lambda f: f.cancelled() or f.exception())
+        self._inflight[url] = future
+        try:
+            path = await self._download_video(url, platform_name, user_id)
+            future.set_result(path)
+            return path
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            raise
+        finally:
+            self._inflight.pop(url, None)
+
+    def _link_for_user(self, source_path: Optional[str], platform_name: str, user_id: int) -> Optional[str]:
+        """Hardlink a finished download to a per-user path (no bytes copied)."""
+        if not source_path:
+            return None
+
+        ext = os.path.splitext(source_path)[1]
+        filename = f"{platform_name.lower()}_{user_id}_{new_request_id()}{ext}"
+        linked_path = os.path.join(self.temp_dir, filename)
+        try:
+            os.link(source_path, linked_path)
+            return linked_path
+        except OSError as e:
+            logger.warning("Could not link shared download %s: %s", source_path, e)
+            return None
+
+    async def _download_video(self, url: str, platform_name: str, user_id: int) -> Optional[str]:
         """Download video: try direct extractor first, then yt-dlp fallback."""
 
         # TRY 1: Cobalt-style direct extractor (fast, no yt-dlp overhead)
         try:
             extractor_path = await self.try_extractor(url, platform_name, user_id)
             if extractor_path:
-                logger.info(f"Direct extractor succeeded for {platform_name}")
+                logger.info("Direct extractor succeeded")
                 return extractor_path
             else:
-                logger.info(f"Direct extractor returned nothing for {platform_name}, falling back to yt-dlp")
+                logger.info("Direct extractor returned nothing, falling back to yt-dlp")
         except Exception as e:
-            logger.info(f"Direct extractor error for {platform_name}: {e}, falling back to yt-dlp")
+            logger.info("Direct extractor error: %s, falling back to yt-dlp", e)
 
         # TRY 2: yt-dlp fallback
-        request_id = str(uuid.uuid4())[:8]
+        request_id = new_request_id()
         filename = f"{platform_name.lower()}_{user_id}_{request_id}.%(ext)s"
         output_path = os.path.join(self.temp_dir, filename)
         base_path = output_path.replace('.%(ext)s', '')
 
         last_error = None
 
-        for attempt, format_string in enumerate(FORMAT_ATTEMPTS, 1):
-            try:
-                logger.info(
-                    f"[Attempt {attempt}/{len(FORMAT_ATTEMPTS)}] "
-                    f"Downloading from {platform_name}: {url} (format: {format_string})"
-                )
-
-                options = self.get_simple_ytdlp_options(output_path, format_string)
-
-                def run_download():
-                    with yt_dlp.YoutubeDL(options) as ydl:
-                        ydl.download([url])
-
-                    # Find downloaded file
-                    for ext in ['.mp4', '.webm', '.mkv', '.avi', '.mov', '.flv', '.m4v']:
-                        potential_path = base_path + ext
-                        if os.path.exists(potential_path):
-                            return potential_path
-                    return None
-
-                loop = asyncio.get_event_loop()
-                downloaded_path = await loop.run_in_executor(None, run_download)
+        # One YoutubeDL per URL: retries only swap the format selector, so
+        # extractor init and player JS are not redone on every attempt
+        options = self.get_simple_ytdlp_options(output_path, FORMAT_ATTEMPTS[0])
+        ydl = await run_in_executor(_DOWNLOAD_POOL, yt_dlp.YoutubeDL, options)
+        # Raw extractor result, fetched once and re-processed per format
+        info = None
 
-                if downloaded_path and os.path.exists(downloaded_path):
-                    file_size = get_file_size_mb(downloaded_path)
+        try:
+            for attempt, format_string in enumerate(FORMAT_ATTEMPTS, 1):
+                retry_delay = 0.0
+                try:
                     logger.info(
-                        f"Successfully downloaded {platform_name} video: "
-                        f"{file_size:.2f}MB (attempt {attempt})"
+                        "[Attempt %d/%d] Downloading %s (format: %s)",
+                        attempt, len(FORMAT_ATTEMPTS), url, format_string
                     )
-                    return downloaded_path
-                else:
-                    logger.warning(
-                        f"[Attempt {attempt}] Download completed but no file found"
-                    )
-                    last_error = Exception("Download completed but no output file found")
-
-            except yt_dlp.utils.DownloadError as e:
-                last_error = e
-                error_msg = classify_download_error(e)
-                logger.warning(
-                    f"[Attempt {attempt}] yt-dlp DownloadError: {e}"
-                )
-                # Don't retry on permanent errors (private, deleted, age-restricted, geo)
-                if any(marker in error_msg for marker in ['🔒', '❌', '🔞', '🌍', '🚫']):
-                    logger.info(f"Permanent error detected, skipping further retries")
-                    break
 
-            except Exception as e:
-                last_error = e
-                logger.warning(f"[Attempt {attempt}] Error: {e}")
-
-            # Clean up any partial files before retry
-            for ext in ['.mp4', '.webm', '.mkv', '.avi', '.mov', '.flv', '.m4v', '.part']:
-                potential_path = base_path + ext
-                if os.path.exists(potential_path):
-                    try:
-                        os.unlink(potential_path)
-                    except Exception:
-                        pass
+                    def run_download():
+                        nonlocal info
+                        ydl.params['format'] = format_string
+                        ydl.format_selector = ydl.build_format_selector(format_string)
+                        if info is not None:
+                            # process_ie_result mutates the dict, keep the original for retries
+                            ie_result = copy.deepcopy(info)
+                        else:
+                            ie_result = ydl.extract_info(url, download=False, process=False)
+                            # Only single videos are kept for retries: playlist entries
+                            # can be lazy generators that can't be copied or replayed
+                            if ie_result.get('_type', 'video') == 'video':
+                                info = copy.deepcopy(ie_result)
+                        try:
+                            result = ydl.process_ie_result(ie_result, download=True)
+                        except yt_dlp.utils.ExtractorError as e:
+                            # Only extract_info turns these into DownloadError; match it so
+                            # "no video formats" etc. are classified like before
+                            raise yt_dlp.utils.DownloadError(f"ERROR: {e}", sys.exc_info()) from e
+
+                        # yt-dlp reports the final path (after any extension change)
+                        return find_downloaded_file(result, base_path)
+
+                    downloaded_path = await run_in_executor(_DOWNLOAD_POOL, run_download)
+
+                    # run_download only returns paths it found on disk; the size
+                    # is measured once by the caller
+                    if downloaded_path:
+                        logger.info("Successfully downloaded video (attempt %d)", attempt)
+                        return downloaded_path
+                    else:
+                        logger.warning(
+                            "[Attempt %d] Download completed but no file found", attempt
+                        )
+                        last_error = Exception("Download completed but no output file found")
+
+                except yt_dlp.utils.DownloadError as e:
+                    last_error = e
+                    error_msg = classify_download_error(e)
+                    logger.warning("[Attempt %d] yt-dlp DownloadError: %s", attempt, e)
+                    # Don't retry on permanent errors (private, deleted, age-restricted, geo),
+                    # unless the failure was throttling or a server error
+                    if not is_transient_error(e) and any(
+                        marker in error_msg for marker in ['🔒', '❌', '🔞', '🌍', '🚫']
+                    ):
+                        logger.info("Permanent error detected, skipping further retries")
+                        break
+                    retry_delay = get_retry_delay(e, attempt)
+
+                except Exception as e:
+                    last_error = e
+                    logger.warning("[Attempt %d] Error: %s", attempt, e)
+
+                # Clean up any partial files before retry
+                await run_in_executor(None, remove_partial_files, base_path)
+
+                if retry_delay and attempt < len(FORMAT_ATTEMPTS):
+                    logger.info("Backing off %.1fs before next attempt", retry_delay)
+                    await asyncio.sleep(retry_delay)
+        finally:
+            # Closing saves the cookie jar to disk, keep it off the event loop
+            await run_in_executor(None, ydl.__exit__, None, None, None)
 
         # All attempts failed
         if last_error:
@@ -269,15 +480,27 @@ class SimpleVideoDownloader:
         raise Exception("All download attempts failed")
 
 
+_downloader: Optional[SimpleVideoDownloader] = None
+
+
+def get_downloader() -> SimpleVideoDownloader:
+    global _downloader
+    if _downloader is None:
+        _downloader = SimpleVideoDownloader()
+    return _downloader
+
+
 async def process_social_media_video(message, bot, url, platform_name, progress_msg=None):
-    downloader = SimpleVideoDownloader()
+    downloader = get_downloader()
+    editor = ProgressEditor(progress_msg)
     temp_video_path = None
+    # Every log line of this request gets the platform/user prefix
+    context_token = request_context.set(f"{platform_name}:{message.from_user.id}")
 
     try:
         # Update progress with platform-specific message
         if progress_msg:
-            await safe_edit_message(
-                progress_msg,
+            await editor.update(
                 PROGRESS_MESSAGES['downloading'].format(platform=platform_name)
             )
 
@@ -288,127 +511,115 @@ async def process_social_media_video(message, bot, url, platform_name, progress_
             raise Exception("Failed to download video")
 
         # Check file size
-        file_size_mb = get_file_size_mb(temp_video_path)
-        logger.info(f"{platform_name} video size: {file_size_mb:.2f}MB")
+        file_size = get_file_size(temp_video_path)
+        file_size_mb = file_size / (1024 * 1024)
+        logger.info("Video size: %.2fMB", file_size_mb)
 
         if progress_msg:
-            await safe_edit_message(
-                progress_msg,
-                PROGRESS_MESSAGES['processing']
-            )
+            await editor.update(PROGRESS_MESSAGES['processing'])
 
         # Check Telegram size limit
-        if file_size_mb > TELEGRAM_VIDEO_SIZE_LIMIT_MB:
+        if file_size > TELEGRAM_VIDEO_SIZE_LIMIT_BYTES:
             too_large_msg = PROGRESS_MESSAGES['too_large'].format(size=file_size_mb)
 
             if progress_msg:
-                await safe_edit_message(progress_msg, too_large_msg)
+                await editor.finish(too_large_msg)
             else:
                 await bot.send_message(message.chat.id, too_large_msg)
 
-            logger.info(f"{platform_name} video too large: {file_size_mb:.2f}MB > {TELEGRAM_VIDEO_SIZE_LIMIT_MB}MB")
+            logger.info("Video too large: %.2fMB > %sMB", file_size_mb, TELEGRAM_VIDEO_SIZE_LIMIT_MB)
             return
 
         if progress_msg:
-            await safe_edit_message(
-                progress_msg,
-                PROGRESS_MESSAGES['sending_video']
-            )
+            await editor.update(PROGRESS_MESSAGES['sending_video'])
 
         # Send video and document in media group (it's within size limit)
         await send_video_with_fallback(bot, message, temp_video_path, platform_name)
 
         # Success message
         if progress_msg:
-            await safe_edit_message(
-                progress_msg,
-                PROGRESS_MESSAGES['done'].format(size=file_size_mb)
-            )
+            await editor.finish(PROGRESS_MESSAGES['done'].format(size=file_size_mb))
 
-        logger.info(f"{platform_name} video processed successfully")
+        logger.info("Video processed successfully")
 
     except yt_dlp.utils.DownloadError as e:
         error_message = classify_download_error(e)
-        logger.error(f"yt-dlp error processing {platform_name} video: {e}")
+        logger.error("yt-dlp error processing video: %s", e)
 
         if progress_msg:
-            await safe_edit_message(progress_msg, error_message)
+            await editor.finish(error_message)
         else:
             await bot.send_message(message.chat.id, error_message)
 
     except Exception as e:
-        logger.error(f"Error processing {platform_name} video: {str(e)}")
+        logger.error("Error processing video: %s", e)
 
         # Try to classify even generic exceptions
-        error_str = str(e).lower()
-        if 'timeout' in error_str or 'timed out' in error_str:
-            error_message = "⏳ Timeout — try again in a moment"
-        elif 'failed to download' in error_str:
-            error_message = "⚠️ Download failed — please try another link"
-        else:
-            short = str(e)[:100]
-            error_message = f"⚠️ Something went wrong. Error: {short}"
+        error_str = str(e)
+        error_message = (
+            _match_error(GENERIC_ERROR_RULES, error_str)
+            or f"⚠️ Something went wrong. Error: {error_str[:100]}"
+        )
 
         if progress_msg:
-            await safe_edit_message(progress_msg, error_message)
+            await editor.finish(error_message)
         else:
             await bot.send_message(message.chat.id, error_message)
 
     finally:
+        # File removal blocks, keep it off the event loop
         # Cleanup temp file
-        if temp_video_path and os.path.exists(temp_video_path):
+        if temp_video_path:
             try:
-                os.unlink(temp_video_path)
-                logger.debug(f"Cleaned up: {temp_video_path}")
+                if await run_in_executor(None, safe_unlink, temp_video_path):
+                    logger.debug("Cleaned up: %s", temp_video_path)
             except Exception as e:
-                logger.warning(f"Cleanup failed: {e}")
+                logger.warning("Cleanup failed: %s", e)
 
         # Periodic cleanup of old temp files
         try:
-            cleanup_temp_directory()
+            await run_in_executor(None, cleanup_temp_directory)
         except Exception:
             pass
 
+        request_context.reset(context_token)
+
 
 async def send_video_with_fallback(bot, message, video_path: str, platform_name: str):
-    video_sent = False
-    document_sent = False
-    errors = []
-    video_message = None
+    video_file = FSInputFile(video_path, chunk_size=UPLOAD_CHUNK_SIZE)
+    file_name = f"{platform_name.lower()}_video.mp4"
+    doc_file = FSInputFile(video_path, filename=file_name, chunk_size=UPLOAD_CHUNK_SIZE)
 
-    # Send as video first
-    try:
-        video_file = FSInputFile(video_path)
-        video_message = await bot.send_video(
+    # Both uploads are independent — run them side by side
+    video_result, doc_result = await asyncio.gather(
+        bot.send_video(
             chat_id=message.chat.id,
             video=video_file,
             supports_streaming=True
-        )
-        logger.info("Video sent successfully")
-        video_sent = True
-    except Exception as video_error:
-        logger.warning(f"Failed to send as video: {video_error}")
-        errors.append(f"Video: {video_error}")
-
-    # Send as document second, with reply to video if available
-    try:
-        file_name = f"{platform_name.lower()}_video.mp4"
-        doc_file = FSInputFile(video_path, filename=file_name)
-
-        # Reply to video message if it was sent successfully
-        reply_to_message_id = video_message.message_id if video_message else None
-
-        await bot.send_document(
+        ),
+        bot.send_document(
             chat_id=message.chat.id,
             document=doc_file,
-            reply_to_message_id=reply_to_message_id,
             disable_content_type_detection=True
-        )
+        ),
+        return_exceptions=True,
+    )
+
+    errors = []
+
+    video_sent = not isinstance(video_result, BaseException)
+    if video_sent:
+        logger.info("Video sent successfully")
+    else:
+        logger.warning("Failed to send as video: %s", video_result)
+        errors.append(f"Video: {video_result}")
+
+    document_sent = not isinstance(doc_result, BaseException)
+    if document_sent:
         logger.info("Video sent as document")
-        document_sent = True
-    except Exception as doc_error:
-        logger.warning(f"Failed to send as document: {doc_error}")
-        errors.append(f"Document: {doc_error}")
+    else:
+        logger.warning("Failed to send as document: %s", doc_result)
+        errors.append(f"Document: {doc_result}")
 
     # Check if at least one method succeeded
     if not video_sent and not document_sent:
@@ -417,7 +628,7 @@ async def send_video_with_fallback(bot, message, video_path: str, platform_name:
 
     # Log success status
     if video_sent and document_sent:
-        logger.info("Video sent successfully in both formats (linked)")
+        logger.info("Video sent successfully in both formats")
     elif video_sent:
         logger.info("Video sent successfully as video only")
     elif document_sent:
@@ -426,9 +637,9 @@ async def send_video_with_fallback(bot, message, video_path: str, platform_name:
 
 async def detect_platform_and_process(message, bot, url, progress_msg=None):
     # Check supported platforms
-    for domain, platform_name in PLATFORM_IDENTIFIERS.items():
-        if domain in url:
-            await process_social_media_video(message, bot, url, platform_name, progress_msg)
-            return True
+    platform_name = detect_platform(url)
+    if not platform_name:
+        return False
 
-    return False
+    await process_social_media_video(message, bot, url, platform_name, progress_msg)
+    return True
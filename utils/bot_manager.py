@@ -42,23 +42,23 @@ class BotManager:
 
             try:
                 await bot.send_message(admin_id, message)
-                logger.info(f"Message sent to admin {admin_id}")
+                logger.info("Message sent to admin %s", admin_id)
             except TelegramAPIError as e:
-                logger.error(f"Failed to send message to admin {admin_id}: {e}")
+                logger.error("Failed to send message to admin %s: %s", admin_id, e)
 
     @classmethod
     async def send_admin_notification(cls, message: str, admin_id: int) -> bool:
         if admin_id not in ADMIN_IDS:
-            logger.warning(f"Attempted to send admin notification to non-admin: {admin_id}")
+            logger.warning("Attempted to send admin notification to non-admin: %s", admin_id)
             return False
 
         bot = cls.get_bot()
         try:
             await bot.send_message(admin_id, message)
-            logger.info(f"Admin notification sent to {admin_id}")
+            logger.info("Admin notification sent to %s", admin_id)
             return True
         except TelegramAPIError as e:
-            logger.error(f"Failed to send admin notification to {admin_id}: {e}")
+            logger.error("Failed to send admin notification to %s: %s", admin_id, e)
             return False
 
 
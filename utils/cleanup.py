@@ -9,21 +9,35 @@ from config import TEMP_DIRECTORY
 logger = logging.getLogger(__name__)
 
 
+def safe_unlink(path: str) -> bool:
+    """Remove a file if it exists. Returns True if a file was removed."""
+    try:
+        os.unlink(path)
+        return True
+    except FileNotFoundError:
+        return False
+
+
 def cleanup_temp_directory():
     """Remove files older than 1 hour from temp directory."""
-    if not os.path.exists(TEMP_DIRECTORY):
-        return
-
     now = time.time()
     removed = 0
-    for f in os.listdir(TEMP_DIRECTORY):
-        path = os.path.join(TEMP_DIRECTORY, f)
-        try:
-            if os.path.isfile(path) and (now - os.path.getmtime(path)) > 3600:
-                os.unlink(path)
-                removed += 1
-        except Exception as e:
-            logger.warning(f"Failed to remove temp file {path}: {e}")
+    try:
+        entries = os.scandir(TEMP_DIRECTORY)
+    except FileNotFoundError:
+        return
+
+    with entries:
+        for entry in entries:
+            try:
+                # scandir entries carry the file type, so only the stat call remains
+                if entry.is_file() and (now - entry.stat().st_mtime) > 3600:
+                    if safe_unlink(entry.path):
+                        removed += 1
+            except FileNotFoundError:
+                continue
+            except Exception as e:
+                logger.warning("Failed to remove temp file %s: %s", entry.path, e)
 
     if removed:
-        logger.info(f"Cleaned up {removed} old temp files")
+        logger.info("Cleaned up %s old temp files", removed)
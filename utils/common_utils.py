@@ -1,6 +1,8 @@
 # common_utils.py - Common utilities and decorators
 
+import asyncio
 import logging
+import time
 from functools import wraps
 from typing import Callable, Any
 
@@ -38,12 +40,12 @@ def handle_errors(error_message: str = "⚠️ Something went wrong. Try again."
                 return await func(message, *args, **kwargs)
             except VideoDownloadError as e:
                 # Pass through specific video download errors with their user-friendly messages
-                logger.warning(f"Video download error in {func.__name__}: {e.user_message}")
+                logger.warning("Video download error in %s: %s", func.__name__, e.user_message)
                 if e.original_error:
-                    logger.error(f"Original error: {e.original_error}")
+                    logger.error("Original error: %s", e.original_error)
                 await message.answer(e.user_message)
             except Exception as e:
-                logger.error(f"Error in {func.__name__}: {e}", exc_info=True)
+                logger.error("Error in %s: %s", func.__name__, e, exc_info=True)
                 await message.answer(error_message)
         return wrapper
     return decorator
@@ -58,7 +60,64 @@ async def safe_edit_message(progress_msg, new_text: str):
             return
         await progress_msg.edit_text(new_text)
     except Exception as e:
-        logger.debug(f"Message edit failed: {e}")
+        logger.debug("Message edit failed: %s", e)
+
+
+class ProgressEditor:
+    """Coalesces progress-message edits to save Telegram round trips.
+
+    Repeated text is dropped and updates closer than ``min_interval`` apart
+    are held back; the latest held text is sent once the interval passes.
+    ``finish`` always delivers the final text. Edits go out one at a time,
+    so a slow in-flight edit can't land after a newer one.
+    """
+
+    def __init__(self, progress_msg, min_interval: float = 1.0):
+        self.progress_msg = progress_msg
+        self.min_interval = min_interval
+        self._last_text = getattr(progress_msg, "text", None)
+        self._last_sent_at = 0.0
+        self._pending = None
+        self._flush_task = None
+        self._send_lock = asyncio.Lock()
+
+    async def update(self, new_text: str):
+        if not self.progress_msg or new_text == self._last_text:
+            return
+
+        wait = self.min_interval - (time.monotonic() - self._last_sent_at)
+        if wait <= 0:
+            await self._send(new_text)
+            return
+
+        self._pending = new_text
+        if self._flush_task is None:
+            self._flush_task = asyncio.create_task(self._delayed_flush(wait))
+
+    async def finish(self, new_text: str):
+        if self._flush_task:
+            self._flush_task.cancel()
+            self._flush_task = None
+        self._pending = None
+        if self.progress_msg:
+            await self._send(new_text)
+
+    async def _delayed_flush(self, delay: float):
+        await asyncio.sleep(delay)
+        self._flush_task = None
+        if self._pending is not None:
+            # Shielded: if finish() cancels us mid-edit, the edit still completes
+            # and finish() queues behind it on the lock
+            await asyncio.shield(self._send(self._pending))
+
+    async def _send(self, new_text: str):
+        self._pending = None
+        async with self._send_lock:
+            if new_text == self._last_text:
+                return
+            self._last_text = new_text
+            self._last_sent_at = time.monotonic()
+            await safe_edit_message(self.progress_msg, new_text)
 
 
 def get_user_info_from_message(message: Message) -> dict:
@@ -79,10 +138,10 @@ def ensure_user_exists(message: Message) -> dict:
     user = get_user(user_id)
     if not user:
         user = create_user(user_id, username, language_code)
-        logger.info(f"Created new user: {user_id}")
+        logger.info("Created new user: %s", user_id)
     else:
         update_user(user_id, username, language_code)
-        logger.debug(f"Updated existing user: {user_id}")
+        logger.debug("Updated existing user: %s", user_id)
 
     return user
 
@@ -108,7 +167,7 @@ async def send_message_with_fallback(bot: Bot, chat_id: int, text: str, parse_mo
             return await bot.send_message(chat_id, text, parse_mode=parse_mode, **kwargs)
 
     except Exception as e:
-        logger.error(f"Failed to send message to {chat_id}: {e}")
+        logger.error("Failed to send message to %s: %s", chat_id, e)
         # Try without parse_mode as fallback
         if parse_mode:
             return await bot.send_message(chat_id, text, **kwargs)
@@ -0,0 +1,27 @@
+# log_context.py - Request-scoped logging context
+
+import asyncio
+import contextvars
+import logging
+
+# Set once per request (e.g. "YouTube:12345"); asyncio tasks inherit it
+request_context = contextvars.ContextVar("request_context", default=None)
+
+
+class RequestContextFilter(logging.Filter):
+    """Adds %(request)s to every record: "[<context>] " inside a request, "" outside."""
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        ctx = request_context.get()
+        record.request = f"[{ctx}] " if ctx else ""
+        return True
+
+
+def run_in_executor(executor, func, *args):
+    """``loop.run_in_executor`` that carries the request context into the worker.
+
+    Executor threads don't inherit contextvars, so without this their log
+    lines lose the request prefix.
+    """
+    loop = asyncio.get_running_loop()
+    return loop.run_in_executor(executor, contextvars.copy_context().run, func, *args)
@@ -1,37 +1,37 @@
 # rate_limiter.py - In-memory rate limiting
 
 import time
-from collections import defaultdict
+from collections import defaultdict, deque
 
 
 class RateLimiter:
     def __init__(self, max_requests=3, window_seconds=60):
-        self.requests = defaultdict(list)
+        # Per-user ring buffer of request times, oldest first
+        self.requests = defaultdict(lambda: deque(maxlen=max_requests))
         self.max_requests = max_requests
         self.window = window_seconds
 
+    def _expire(self, user_id: int, now: float) -> deque:
+        # Times are appended in order, so expired entries are always at the head
+        timestamps = self.requests[user_id]
+        while timestamps and now - timestamps[0] >= self.window:
+            timestamps.popleft()
+        return timestamps
+
     def is_allowed(self, user_id: int) -> bool:
-        now = time.time()
-        # Clean old entries
-        self.requests[user_id] = [
-            t for t in self.requests[user_id] if now - t < self.window
-        ]
-        if len(self.requests[user_id]) >= self.max_requests:
+        now = time.monotonic()
+        timestamps = self._expire(user_id, now)
+        if len(timestamps) >= self.max_requests:
             return False
-        self.requests[user_id].append(now)
+        timestamps.append(now)
         return True
 
     def seconds_until_allowed(self, user_id: int) -> int:
-        if not self.requests[user_id]:
-            return 0
-        now = time.time()
-        # Clean old entries first
-        self.requests[user_id] = [
-            t for t in self.requests[user_id] if now - t < self.window
-        ]
-        if not self.requests[user_id]:
+        now = time.monotonic()
+        timestamps = self._expire(user_id, now)
+        if not timestamps:
             return 0
-        oldest = min(self.requests[user_id])
+        oldest = timestamps[0]
         return max(0, int(self.window - (now - oldest)))
 
 
@@ -14,7 +14,7 @@ def get_user_agent_instance():
         try:
             _ua = UserAgent()
         except Exception as e:
-            logger.warning(f"Failed to initialize UserAgent with real data: {e}")
+            logger.warning("Failed to initialize UserAgent with real data: %s", e)
             # Fallback to a static list if the service is down
             _ua = UserAgent(fallback='Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36')
     return _ua
@@ -24,7 +24,7 @@ def _get_user_agent_with_fallback(user_agent_type: str, default_fallback: str):
         ua = get_user_agent_instance()
         return getattr(ua, user_agent_type)
     except Exception as e:
-        logger.warning(f"Failed to get {user_agent_type} user agent: {e}")
+        logger.warning("Failed to get %s user agent: %s", user_agent_type, e)
         return default_fallback
 
 
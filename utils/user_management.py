@@ -13,8 +13,6 @@ from config import (
     MONGODB_USERS_COLLECTION,
 )
 
-# Set up logging
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 # MongoDB connection with resilience
@@ -34,11 +32,21 @@ try:
     users_collection = db[MONGODB_USERS_COLLECTION]
     logger.info("Successfully connected to MongoDB")
 except Exception as e:
-    logger.warning(f"MongoDB unavailable — running without user tracking: {e}")
+    logger.warning("MongoDB unavailable — running without user tracking: %s", e)
     client = None
     db = None
     users_collection = None
 
+# Bumped on every write that changes usage stats; the cached stats are
+# reused until it moves
+_write_seq = 0
+_stats_cache = None
+
+
+def _bump_write_seq():
+    global _write_seq
+    _write_seq += 1
+
 
 def _db_op(func, default=None):
     """Wrap a DB operation — return default if DB is down."""
@@ -47,7 +55,7 @@ def _db_op(func, default=None):
     try:
         return func()
     except Exception as e:
-        logger.warning(f"MongoDB operation failed: {e}")
+        logger.warning("MongoDB operation failed: %s", e)
         return default
 
 
@@ -64,6 +72,7 @@ def create_user(user_id, username=None, language=None):
         "created_at": datetime.now(),
     }
     _db_op(lambda: users_collection.insert_one(user))
+    _bump_write_seq()
     return user
 
 
@@ -86,6 +95,7 @@ def increment_download_count(user_id):
         {"user_id": user_id},
         {"$inc": {"downloads_count": 1}}
     ))
+    _bump_write_seq()
 
 
 def is_admin(user_id):
@@ -103,6 +113,10 @@ def get_users_with_usernames():
 
 
 def get_usage_stats():
+    global _stats_cache
+    if _stats_cache is not None and _stats_cache[0] == _write_seq:
+        return dict(_stats_cache[1])
+
     def _stats():
         total_users = users_collection.count_documents({})
         total_downloads = users_collection.aggregate([
@@ -116,7 +130,12 @@ def get_usage_stats():
             "total_downloads": total_downloads_count,
         }
 
-    return _db_op(_stats, default={"total_users": 0, "total_downloads": 0})
+    seq = _write_seq
+    stats = _db_op(_stats)
+    if stats is None:
+        return {"total_users": 0, "total_downloads": 0}
+    _stats_cache = (seq, stats)
+    return dict(stats)
 
 
 async def broadcast_message_to_all_users(bot: Bot, message_text: str):
@@ -133,7 +152,7 @@ async def broadcast_message_to_all_users(bot: Bot, message_text: str):
             successful_sends += 1
         except TelegramAPIError as e:
             failed_sends += 1
-            logger.warning(f"Failed to send message to {user['user_id']}: {e}")
+            logger.warning("Failed to send message to %s: %s", user['user_id'], e)
 
     return successful_sends, failed_sends
 